@@ -1,14 +1,42 @@
+import os
+from contextlib import contextmanager
 import pandas as pd
 from amplpy import AMPL
 import matplotlib.pyplot as plt
 
-# run 60 shifts of the single-shift model while updating data in-between iterations
-# to simulate a month. accepts list TRUCKS as argument.
-def model(TRUCKS):
+# telemetry is optional: without it model() runs without records
+try:
+    from telemetry import SolveRecord, solve_ampl, format_summary
+except ImportError:
+    SolveRecord = None
+
+# directory holding aux.mod and proj.mod, so the model can be run from anywhere
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# stand-in for telemetry.SolveRecord when model() keeps no records
+class NoRecord:
+    @contextmanager
+    def phase(self, name):
+        yield self
+
+# a telemetry.SolveRecord appended to records, or a NoRecord if records is None
+def new_record(label, records, profile, trace_memory):
+    if records is None:
+        return NoRecord()
+    record = SolveRecord('fleet', label, profile=profile, trace_memory=trace_memory)
+    records.append(record)
+    return record
+
+# solve the current AMPL model, timed by solve_ampl when recording
+def solve(record, ampl):
+    if isinstance(record, NoRecord):
+        ampl.solve()
+    else:
+        solve_ampl(record, ampl)
 
-    # initialize the AMPL environment and choose the solver
-    ampl = AMPL()
-    ampl.option['solver'] = 'gurobi'
+# build the default problem data for the list TRUCKS. returns a dictionary with
+# the sets and parameters used by model().
+def default_data(TRUCKS):
 
     # Data - note that data is defined here, rather than in an AMPL data file,
     #   so changes to the underlying problem data must be made directly here.
@@ -100,53 +128,105 @@ def model(TRUCKS):
     #   dictionary like for the above parameters - these defaults just apply to all dictionary keys.
     avg_speed, shift_duration, load_unload_time = 45, 12, 2
 
-    # read auxillary model file
-    ampl.read('aux.mod')
-    # set auxillary data
-    ampl.set['DEPOTS'] = set(DEPOTS)
-    ampl.set['STATIONS'] = set(STATIONS)
-    ampl.set['PRODUCTS'] = set(PRODUCTS)
-    ampl.set['TRUCKS'] = set(TRUCKS)
-    ampl.param['distance'] = {(depot, station):num for (depot,station),num in distance.items()}
-    ampl.param['capacity_truck'] = {(truck,product):num for (truck,product),num in capacity_truck.items()}
-    ampl.param['full_capacity_station'] = {(station,product):num for (station,product),num in full_capacity_station.items()}
-    ampl.param['supply'] = {(depot,product):num for (depot,product),num in supply.items()}
-    ampl.param['capacity_station'] = {(station,product):num for (station,product),num in capacity_station.items()}
+    return {
+        'DEPOTS': DEPOTS,
+        'STATIONS': STATIONS,
+        'PRODUCTS': PRODUCTS,
+        'distance': distance,
+        'supply': supply,
+        'capacity_truck': capacity_truck,
+        'capacity_station': capacity_station,
+        'sales_station': sales_station,
+        'full_capacity_station': full_capacity_station,
+    }
+
+# run 60 shifts of the single-shift model while updating data in-between iterations
+# to simulate a month. accepts list TRUCKS as argument, and optionally the problem
+# data (in the format returned by default_data) and the number of shifts.
+# if a list is given as records (needs the telemetry package), one
+# telemetry.SolveRecord is appended for the auxillary solve and one per shift,
+# with load/build/solve/extract times; profile and trace_memory turn on
+# cProfile and tracemalloc for these records.
+def model(TRUCKS, data=None, shifts=60, records=None, profile=False, trace_memory=False):
+
+    # telemetry of the auxillary solve
+    record = new_record('aux', records, profile, trace_memory)
+
+    with record.phase('build'):
+        # initialize the AMPL environment and choose the solver
+        ampl = AMPL()
+        ampl.option['solver'] = 'gurobi'
+
+    with record.phase('load'):
+        if data is None:
+            data = default_data(TRUCKS)
+        DEPOTS, STATIONS, PRODUCTS = data['DEPOTS'], data['STATIONS'], data['PRODUCTS']
+        distance = data['distance']
+        capacity_truck = data['capacity_truck']
+        sales_station = data['sales_station']
+        full_capacity_station = data['full_capacity_station']
+        # supply and capacity_station are updated every shift, so work on copies
+        supply = dict(data['supply'])
+        capacity_station = dict(data['capacity_station'])
+
+    with record.phase('build'):
+        # read auxillary model file
+        ampl.read(os.path.join(MODEL_DIR, 'aux.mod'))
+        # set auxillary data
+        ampl.set['DEPOTS'] = set(DEPOTS)
+        ampl.set['STATIONS'] = set(STATIONS)
+        ampl.set['PRODUCTS'] = set(PRODUCTS)
+        ampl.set['TRUCKS'] = set(TRUCKS)
+        ampl.param['distance'] = {(depot, station):num for (depot,station),num in distance.items()}
+        ampl.param['capacity_truck'] = {(truck,product):num for (truck,product),num in capacity_truck.items()}
+        ampl.param['full_capacity_station'] = {(station,product):num for (station,product),num in full_capacity_station.items()}
+        ampl.param['supply'] = {(depot,product):num for (depot,product),num in supply.items()}
+        ampl.param['capacity_station'] = {(station,product):num for (station,product),num in capacity_station.items()}
     # solve the auxillary model
-    ampl.solve()
+    solve(record, ampl)
     # get the objective value of the auxillary problem
-    max_secondary_objective = sum(distance[d,s] * ampl.get_variable('assign_truck')[d,s,t].value() for d in DEPOTS for s in STATIONS for t in TRUCKS)
+    with record.phase('extract'):
+        max_secondary_objective = sum(distance[d,s] * ampl.get_variable('assign_truck')[d,s,t].value() for d in DEPOTS for s in STATIONS for t in TRUCKS)
 
     # create a list to store solution statistics
     shipped_summary = []
 
-    # reset the AMPL model
-    ampl.reset()
-    # read the main model file
-    ampl.read('proj.mod')
-    # set initial data in the model
-    ampl.set['DEPOTS'] = set(DEPOTS)
-    ampl.set['STATIONS'] = set(STATIONS)
-    ampl.set['PRODUCTS'] = set(PRODUCTS)
-    ampl.set['TRUCKS'] = set(TRUCKS)
-    ampl.param['distance'] = {(depot, station):num for (depot,station),num in distance.items()}
-    ampl.param['capacity_truck'] = {(truck,product):num for (truck,product),num in capacity_truck.items()}
-    ampl.param['full_capacity_station'] = {(station,product):num for (station,product),num in full_capacity_station.items()}
-    ampl.param['max_secondary_objective'] = max_secondary_objective
-
-    # calculate a solution to all 60 shifts in the month
-    for iteration in range(60):
+    # telemetry of the first shift, which also covers building the main model
+    record = new_record('shift 1', records, profile, trace_memory)
+
+    with record.phase('build'):
+        # reset the AMPL model
+        ampl.reset()
+        # read the main model file
+        ampl.read(os.path.join(MODEL_DIR, 'proj.mod'))
+        # set initial data in the model
+        ampl.set['DEPOTS'] = set(DEPOTS)
+        ampl.set['STATIONS'] = set(STATIONS)
+        ampl.set['PRODUCTS'] = set(PRODUCTS)
+        ampl.set['TRUCKS'] = set(TRUCKS)
+        ampl.param['distance'] = {(depot, station):num for (depot,station),num in distance.items()}
+        ampl.param['capacity_truck'] = {(truck,product):num for (truck,product),num in capacity_truck.items()}
+        ampl.param['full_capacity_station'] = {(station,product):num for (station,product),num in full_capacity_station.items()}
+        ampl.param['max_secondary_objective'] = max_secondary_objective
+
+    # calculate a solution to all shifts in the month (60 by default)
+    for iteration in range(shifts):
         print(f"\n--- Iteration {iteration+1} ---")
-        
+
+        if iteration > 0:
+            record = new_record(f'shift {iteration+1}', records, profile, trace_memory)
+
         # set supply and capacity_station params based of current data
-        ampl.param['supply'] = {(depot,product):num for (depot,product),num in supply.items()}
-        ampl.param['capacity_station'] = {(station,product):num for (station,product),num in capacity_station.items()}
+        with record.phase('build'):
+            ampl.param['supply'] = {(depot,product):num for (depot,product),num in supply.items()}
+            ampl.param['capacity_station'] = {(station,product):num for (station,product),num in capacity_station.items()}
         # solve the model
-        ampl.solve()
+        solve(record, ampl)
 
         # get the primary objective value
-        shipped = {(d, s, p): sum(capacity_truck[t,p] * ampl.get_variable('assign_truck')[d,s,t].value() for t in TRUCKS)
-                for d in DEPOTS for s in STATIONS for p in PRODUCTS}
+        with record.phase('extract'):
+            shipped = {(d, s, p): sum(capacity_truck[t,p] * ampl.get_variable('assign_truck')[d,s,t].value() for t in TRUCKS)
+                    for d in DEPOTS for s in STATIONS for p in PRODUCTS}
 
         # Update capacity_station data based on sales and received shipments
         for s in STATIONS:
@@ -198,10 +278,18 @@ if __name__ == '__main__':
     # get list of all different-truck models
     MODELS = model_dict.keys()
 
-    # get solutions to each model
+    # get solutions to each model, keeping the telemetry of every solve
     model_solution_dict = dict()
+    model_records = dict()
     for m in MODELS:
-        model_solution_dict[m] = model(model_dict[m])
+        model_records[m] = [] if SolveRecord is not None else None
+        model_solution_dict[m] = model(model_dict[m], records=model_records[m])
+
+    # time spent in each phase, summed over the auxillary solve and all shifts
+    if SolveRecord is not None:
+        for m in MODELS:
+            print(f"\n=== {m}: time per phase (seconds) ===")
+            print(format_summary(model_records[m]))
 
     # Assuming for eaah model DataFrame with columns: Iteration, Product, Total_Stock is returned
     # plot the stock graph of each model for each product
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Batch checker for the k-sum threshold property.
+
+Check_k_sum_threshold.mod answers one question per .dat file: given the
+vertex set V = {1..n} and a family S of k-sets, is there a graph whose
+independent k-sets are exactly S, and weights w / threshold t such that
+
+    sum_{v in U} w[v] <= t - delta   for U in S,
+    sum_{v in U} w[v] >= t + delta   for every other k-set U,
+
+with margin delta > 0?
+
+This script runs the same model over many families at once:
+
+  1. every (n, k, S) is relabeled into a canonical form, so families that
+     only differ by a permutation of the vertices share one key;
+  2. results are cached on disk under that key (margin delta, weights w,
+     threshold t, edges of the graph x), separately for every solver and
+     version of the model file;
+  3. the remaining unique keys are solved in parallel by a pool of worker
+     processes, each holding one AMPL instance with the model already read;
+  4. one JSON line per input family is written to stdout as soon as its
+     result is known, translated back to the family's own vertex labels.
+     "threshold" is true or false for every answered family (null when
+     the solver gave no answer, e.g. a limit was hit). The solver's own
+     output is dropped, so stdout only carries JSON lines.
+
+Input is JSON lines, one family per line:
+
+    {"n": 5, "k": 3, "S": [[1, 2, 3], [1, 2, 4], [1, 2, 5]]}
+
+Usage:
+
+    python batch_check.py families.jsonl --workers 4 > results.jsonl
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODEL_FILE = os.path.join(HERE, "Check_k_sum_threshold.mod")
+CACHE_DIR = os.path.join(HERE, ".threshold_cache")
+
+# delta above this value counts as a strictly positive margin
+MARGIN_TOL = 1e-6
+
+# solve results that are answers; anything else (limit, failure, ...) is
+# reported but not cached, so the next run tries again
+CACHED_STATUSES = ("solved", "infeasible")
+
+
+# ------------------------------------------------------------
+# 1. Canonical form under vertex permutation
+# ------------------------------------------------------------
+
+def normalize_family(n, k, S):
+    """
+    Validate a family and return it as a sorted tuple of sorted k-tuples.
+    Duplicate sets are dropped.
+    """
+    family = set()
+    for U in S:
+        U = tuple(sorted(int(v) for v in U))
+        if len(U) != k or len(set(U)) != k:
+            raise ValueError(f"{list(U)} is not a {k}-set")
+        if U[0] < 1 or U[-1] > n:
+            raise ValueError(f"{list(U)} is not a subset of 1..{n}")
+        family.add(U)
+    return tuple(sorted(family))
+
+
+def refine(cells, sets_of):
+    """
+    Split the cells of an ordered vertex partition until it is equitable.
+
+    A vertex's signature lists, for every set of S containing it, the
+    cells of the other vertices in that set. Each cell is split by
+    signature, in sorted signature order, until no cell splits any more.
+    Signatures only depend on the partition, not on vertex labels, so
+    relabeling S relabels the result in the same way.
+    """
+    while True:
+        cell_of = {v: i for i, cell in enumerate(cells) for v in cell}
+        new_cells = []
+        for cell in cells:
+            if len(cell) == 1:
+                new_cells.append(cell)
+                continue
+            signature = {v: tuple(sorted(tuple(sorted(cell_of[u] for u in U if u != v))
+                                         for U in sets_of[v]))
+                         for v in cell}
+            for sig in sorted(set(signature.values())):
+                new_cells.append([v for v in cell if signature[v] == sig])
+        if len(new_cells) == len(cells):
+            return new_cells
+        cells = new_cells
+
+
+def same_orbit(v, tried, prefix, automorphisms, n):
+    """
+    True if v is mapped onto one of the `tried` vertices by the
+    automorphisms found so far that fix every vertex of `prefix`.
+    """
+    parent = list(range(n + 1))
+
+    def find(u):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    for g in automorphisms:
+        if all(g[p] == p for p in prefix):
+            for u in range(1, n + 1):
+                parent[find(u)] = find(g[u])
+    return any(find(v) == find(u) for u in tried)
+
+
+def canonical_form(n, k, S):
+    """
+    Relabel the vertices of S so that isomorphic families get the same key.
+
+    This is individualization-refinement, as in nauty: the vertex
+    partition is refined until equitable (see refine); if a cell still
+    holds several vertices, each of them is tried as the next vertex in
+    the order and the search recurses. Every leaf is a full vertex order,
+    and the canonical family is the lexicographically smallest relabeled
+    family over all leaves. Two leaves giving the same family yield an
+    automorphism of S, and branches that such automorphisms map onto an
+    already searched branch are skipped.
+
+    Returns
+    -------
+    key : (n, k, family)
+        Canonical instance, family given on vertices 1..n.
+    relabel : dict[int -> int]
+        relabel[v] = label of original vertex v in the canonical instance.
+    """
+    family = normalize_family(n, k, S)
+    sets_of = {v: [U for U in family if v in U] for v in range(1, n + 1)}
+
+    best = {"family": None, "relabel": None}
+    automorphisms = []
+
+    def leaf(cells):
+        relabel = {cell[0]: i + 1 for i, cell in enumerate(cells)}
+        candidate = tuple(sorted(tuple(sorted(relabel[v] for v in U))
+                                 for U in family))
+        if best["family"] is None or candidate < best["family"]:
+            best["family"], best["relabel"] = candidate, relabel
+        elif candidate == best["family"]:
+            back = {c: v for v, c in best["relabel"].items()}
+            automorphisms.append({v: back[relabel[v]] for v in relabel})
+
+    def search(cells, prefix):
+        cells = refine(cells, sets_of)
+        if len(cells) == n:
+            leaf(cells)
+            return
+        i = next(i for i, cell in enumerate(cells) if len(cell) > 1)
+        tried = []
+        for v in cells[i]:
+            if tried and same_orbit(v, tried, prefix, automorphisms, n):
+                continue
+            tried.append(v)
+            rest = [u for u in cells[i] if u != v]
+            search(cells[:i] + [[v], rest] + cells[i + 1:], prefix + [v])
+
+    search([list(range(1, n + 1))], [])
+    return (n, k, best["family"]), best["relabel"]
+
+
+def key_digest(key):
+    """Stable file name for a canonical key."""
+    n, k, family = key
+    text = json.dumps([n, k, [list(U) for U in family]])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ------------------------------------------------------------
+# 2. On-disk result cache
+# ------------------------------------------------------------
+
+def model_digest(path=MODEL_FILE):
+    """Short hash of the model file, so editing the model starts a new cache."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+
+def cache_subdir(cache_dir, solver):
+    """Cache directory for results of `solver` on the current model file."""
+    return os.path.join(cache_dir, f"{solver}-{model_digest()}")
+
+
+def cache_load(cache_dir, key):
+    """Return the cached result for a canonical key, or None."""
+    path = os.path.join(cache_dir, key_digest(key) + ".json")
+    try:
+        with open(path) as f:
+            return json.load(f)["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        # missing, truncated or unreadable file: solve again
+        return None
+
+
+def cache_store(cache_dir, key, result):
+    """Write a result to the cache (atomically, so readers never see half a file)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    n, k, family = key
+    path = os.path.join(cache_dir, key_digest(key) + ".json")
+    tmp = path + f".{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"n": n, "k": k, "S": [list(U) for U in family],
+                   "result": result}, f)
+    os.replace(tmp, path)
+
+
+# ------------------------------------------------------------
+# 3. Solver workers (one warm AMPL instance per process)
+# ------------------------------------------------------------
+
+_ampl = None
+_init_error = None
+
+
+def kset_name(U):
+    # like the names in the .dat files (u123), but always with separators
+    # (u1_2_3) so that names stay unique for n >= 10
+    return "u" + "_".join(str(v) for v in U)
+
+
+def open_session(solver="highs"):
+    """
+    AMPL instance with the model read and `solver` selected, ready for
+    solve_canonical(). Its output is dropped.
+    """
+    from amplpy import AMPL, OutputHandler
+
+    class DropOutput(OutputHandler):
+        # solver banners and messages would end up between the JSON lines
+        def output(self, kind, msg):
+            pass
+
+    ampl = AMPL()
+    ampl.set_output_handler(DropOutput())
+    ampl.option["solver"] = solver
+    ampl.read(MODEL_FILE)
+    return ampl
+
+
+def init_worker(solver):
+    """Open one session per worker process."""
+    global _ampl
+    _ampl = open_session(solver)
+
+
+def start_worker(solver):
+    """Pool initializer: init_worker, keeping any error for solve_task."""
+    global _init_error
+    try:
+        init_worker(solver)
+    except Exception as exc:
+        _init_error = f"{type(exc).__name__}: {exc}"
+
+
+def solve_task(key):
+    """
+    solve_canonical for the pool. Returns (key, result, error); a failed
+    start or solve gives result None and the error text, so one bad case
+    does not stop the batch.
+    """
+    if _init_error is not None:
+        return key, None, _init_error
+    try:
+        _, result = solve_canonical(key)
+    except Exception as exc:
+        return key, None, f"{type(exc).__name__}: {exc}"
+    return key, result, None
+
+
+def solve_canonical(key, ampl=None):
+    """
+    Solve Check_k_sum_threshold.mod for one canonical instance, in the
+    given session (default: the worker's).
+
+    Returns (key, result) where result holds the solve status and, when a
+    solution exists, delta, t, w (list, w[0] is vertex 1) and the edge
+    list x of the graph. The threshold verdict is added by answer().
+    """
+    n, k, family = key
+    if ampl is None:
+        ampl = _ampl
+    ampl.eval("reset data;")
+
+    V = list(range(1, n + 1))
+    ksets = list(itertools.combinations(V, k))
+    ampl.set["V"] = V
+    ampl.set["KSETS"] = [kset_name(U) for U in ksets]
+    ampl.set["S"] = [kset_name(U) for U in family]
+    ampl.param["inc"] = {(kset_name(U), v): int(v in U)
+                         for U in ksets for v in V}
+
+    ampl.solve()
+    status = ampl.get_value("solve_result")
+    if status != "solved":
+        return key, {"status": status}
+
+    w = ampl.get_variable("w")
+    x = ampl.get_variable("x")
+    delta = ampl.get_variable("delta").value()
+    result = {
+        "status": status,
+        "delta": delta,
+        "t": ampl.get_variable("t").value(),
+        "w": [w[v].value() for v in V],
+        "x": [[i, j] for i, j in itertools.combinations(V, 2)
+              if x[i, j].value() > 0.5],
+    }
+    return key, result
+
+
+# ------------------------------------------------------------
+# 4. Translate canonical results back to the input labels
+# ------------------------------------------------------------
+
+def to_original_labels(result, relabel):
+    """Express weights and edges of a canonical result in the original labels."""
+    if "w" not in result:
+        return dict(result)
+
+    back = {c: v for v, c in relabel.items()}
+    out = dict(result)
+    out["w"] = [result["w"][relabel[v] - 1] for v in sorted(relabel)]
+    out["x"] = sorted(sorted([back[i], back[j]]) for i, j in result["x"])
+    return out
+
+
+def answer(result):
+    """
+    result plus "threshold": delta > MARGIN_TOL when solved, False when
+    infeasible (no graph has exactly S as its independent k-sets), None
+    when the solver gave no answer. Not cached, so MARGIN_TOL can change.
+    """
+    out = dict(result)
+    if result["status"] == "solved":
+        out["threshold"] = result["delta"] > MARGIN_TOL
+    elif result["status"] == "infeasible":
+        out["threshold"] = False
+    else:
+        out["threshold"] = None
+    return out
+
+
+def make_record(index, request, key, result, relabel, cached):
+    """Output line for one input family."""
+    record = {"index": index, "n": request["n"], "k": request["k"],
+              "S": request["S"], "key": key_digest(key), "cached": cached}
+    record.update(to_original_labels(answer(result), relabel))
+    return record
+
+
+def emit(record, stream):
+    stream.write(json.dumps(record) + "\n")
+    stream.flush()
+
+
+# ------------------------------------------------------------
+# 5. Batch driver
+# ------------------------------------------------------------
+
+def run_batch(lines, out=sys.stdout, workers=None, solver="highs",
+              cache_dir=CACHE_DIR):
+    """
+    Check every family given in `lines` (JSON strings) and stream one
+    JSON line per family to `out`.
+
+    Cache hits are written immediately; the other families are written
+    when the solve of their canonical key finishes, so output order is
+    not input order. Each record carries the input line number as "index".
+    A line that cannot be read, or whose solve fails, gives a record with
+    "index" and "error" instead, and the batch goes on.
+    """
+    cache_dir = cache_subdir(cache_dir, solver)
+    pending = {}   # canonical key -> [(index, request, relabel), ...]
+
+    for index, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            n, k = int(request["n"]), int(request["k"])
+            key, relabel = canonical_form(n, k, request["S"])
+        except (ValueError, KeyError, TypeError) as exc:
+            emit({"index": index, "error": f"{type(exc).__name__}: {exc}"}, out)
+            continue
+
+        cached = cache_load(cache_dir, key)
+        if cached is not None:
+            emit(make_record(index, request, key, cached, relabel, True), out)
+        else:
+            pending.setdefault(key, []).append((index, request, relabel))
+
+    if not pending:
+        return
+
+    # no more processes (each starting AMPL) than there are keys to solve
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with Pool(processes=workers, initializer=start_worker,
+              initargs=(solver,)) as pool:
+        for key, result, error in pool.imap_unordered(solve_task, list(pending)):
+            if error is not None:
+                for index, _, _ in pending[key]:
+                    emit({"index": index, "error": error}, out)
+                continue
+            if result["status"] in CACHED_STATUSES:
+                cache_store(cache_dir, key, result)
+            for index, request, relabel in pending[key]:
+                emit(make_record(index, request, key, result, relabel, False), out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check many families S for the k-sum threshold property.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSON lines file with n, k, S (default: stdin)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of solver processes (default: CPU count, "
+                             "at most one per family to solve)")
+    parser.add_argument("--solver", default="highs",
+                        help="AMPL solver to use (default: highs)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help="directory for cached results (one subdirectory "
+                             "per solver and model version)")
+    args = parser.parse_args()
+
+    if args.input == "-":
+        run_batch(sys.stdin, workers=args.workers, solver=args.solver,
+                  cache_dir=args.cache_dir)
+    else:
+        with open(args.input) as f:
+            run_batch(f, workers=args.workers, solver=args.solver,
+                      cache_dir=args.cache_dir)
@@ -32,9 +32,27 @@ Sensitivity analysis:
 from gurobipy import Model, GRB, quicksum
 import xlrd
 from collections import defaultdict
+from contextlib import contextmanager
+
+# telemetry is optional: without it solve_model() runs without records
+try:
+    from telemetry import SolveRecord, gurobi_stats, format_summary
+except ImportError:
+    SolveRecord = None
 
 FILE_NAME = "Supply chain logisitcs problem.xls"
 
+
+class NoRecord:
+    """Stand-in for telemetry.SolveRecord when no records are kept."""
+
+    @contextmanager
+    def phase(self, name):
+        yield self
+
+    def count(self, name, n=1):
+        pass
+
 # ------------------------------------------------------------
 # 1. Read data from Excel
 # ------------------------------------------------------------
@@ -246,7 +264,8 @@ def build_candidates(products, prod_units, prod_weight, prod_dest,
 # 3. MILP solver (capacity in number of orders)
 # ------------------------------------------------------------
 
-def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False):
+def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False, data=None,
+                records=None, profile=False, trace_memory=False):
     """
     Solve the outbound logistics model with given capacity and freight factors.
 
@@ -262,6 +281,15 @@ def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False):
         e.g. 1.10 for +10% rates, 0.90 for -10%.
     verbose : bool
         If True, print Gurobi's solver log.
+    data : tuple or None
+        Data in the format returned by read_data(). If None, the data
+        is read from the Excel workbook.
+    records : list or None
+        If given, a telemetry.SolveRecord with the load / build / solve /
+        extract times and Gurobi's statistics is appended to it (this
+        needs the telemetry package).
+    profile, trace_memory : bool
+        Run cProfile / tracemalloc during the phases of that record.
 
     Returns
     -------
@@ -270,19 +298,32 @@ def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False):
     chosen_routes : dict
         chosen_routes[k] = (w, p, c) for each product k.
     """
+    if records is None:
+        record = NoRecord()
+    else:
+        record = SolveRecord("logistics", f"cap={cap_factor}, freight={freight_factor}",
+                             profile=profile, trace_memory=trace_memory)
+        records.append(record)
+
+    with record.phase("load"):
+        if data is None:
+            data = read_data()
+
     (orders, products, prod_units, prod_weight, prod_dest,
      plants, plant_capacity, plant_unit_cost,
      prod_plants, plant_ports,
      carrier_bands, band_info,
-     prod_order_count) = read_data()
+     prod_order_count) = data
 
     # Build feasible candidates
-    candidates, fixed_cost, var_cost = build_candidates(
-        products, prod_units, prod_weight, prod_dest,
-        prod_plants, plant_ports,
-        carrier_bands, band_info,
-        plant_unit_cost
-    )
+    with record.phase("load"):
+        candidates, fixed_cost, var_cost = build_candidates(
+            products, prod_units, prod_weight, prod_dest,
+            prod_plants, plant_ports,
+            carrier_bands, band_info,
+            plant_unit_cost
+        )
+    record.count("candidates", len(candidates))
 
     # Quick check: each product must have at least one candidate
     bad_products = [k for k in products
@@ -291,37 +332,45 @@ def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False):
         print("WARNING: Some products have no feasible route:", bad_products)
         return None, {}
 
-    m = Model("OutboundLogistics_withCapacity")
-    m.Params.OutputFlag = 1 if verbose else 0
+    with record.phase("build"):
+        m = Model("OutboundLogistics_withCapacity")
+        m.Params.OutputFlag = 1 if verbose else 0
 
-    # Decision variables
-    x = m.addVars(candidates, vtype=GRB.BINARY, name="x")
+        # Decision variables
+        x = m.addVars(candidates, vtype=GRB.BINARY, name="x")
 
-    # Objective: fixed_cost + freight_factor * var_cost
-    m.setObjective(
-        quicksum((fixed_cost[idx] + freight_factor * var_cost[idx]) * x[idx]
-                 for idx in candidates),
-        GRB.MINIMIZE
-    )
+        # Objective: fixed_cost + freight_factor * var_cost
+        m.setObjective(
+            quicksum((fixed_cost[idx] + freight_factor * var_cost[idx]) * x[idx]
+                     for idx in candidates),
+            GRB.MINIMIZE
+        )
 
-    # Assignment: each product k chooses exactly one route
-    for k in products:
-        idx_k = [idx for idx in candidates if idx[0] == k]
-        m.addConstr(quicksum(x[idx] for idx in idx_k) == 1,
-                    name=f"assign_{k}")
-
-    # Capacity constraints in NUMBER OF ORDERS 
-    for w in plants:
-        idx_w = [idx for idx in candidates if idx[1] == w]
-        if idx_w and plant_capacity[w] > 0:
-            cap_eff = cap_factor * plant_capacity[w]
-            m.addConstr(
-                quicksum(prod_order_count[idx[0]] * x[idx] for idx in idx_w)
-                <= cap_eff,
-                name=f"capacity_{w}"
-            )
-
-    m.optimize()
+        # Assignment: each product k chooses exactly one route
+        for k in products:
+            idx_k = [idx for idx in candidates if idx[0] == k]
+            m.addConstr(quicksum(x[idx] for idx in idx_k) == 1,
+                        name=f"assign_{k}")
+
+        # Capacity constraints in NUMBER OF ORDERS 
+        for w in plants:
+            idx_w = [idx for idx in candidates if idx[1] == w]
+            if idx_w and plant_capacity[w] > 0:
+                cap_eff = cap_factor * plant_capacity[w]
+                m.addConstr(
+                    quicksum(prod_order_count[idx[0]] * x[idx] for idx in idx_w)
+                    <= cap_eff,
+                    name=f"capacity_{w}"
+                )
+
+        m.update()
+    record.count("variables", m.NumVars)
+    record.count("constraints", m.NumConstrs)
+
+    with record.phase("solve"):
+        m.optimize()
+    if records is not None:
+        record.set_solver_stats(**gurobi_stats(m))
 
     if m.Status not in (GRB.OPTIMAL, GRB.SUBOPTIMAL):
         print(f"Model did not solve to optimality. Status = {m.Status}")
@@ -329,14 +378,15 @@ def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False):
             print("  -> Model infeasible under these capacity settings.")
         return None, {}
 
-    total_cost = m.ObjVal
-
     # Extract chosen route per product
-    chosen_routes = {}
-    for idx in candidates:
-        if x[idx].X > 0.5:
-            k, w, p, c = idx
-            chosen_routes[k] = (w, p, c)
+    with record.phase("extract"):
+        total_cost = m.ObjVal
+
+        chosen_routes = {}
+        for idx in candidates:
+            if x[idx].X > 0.5:
+                k, w, p, c = idx
+                chosen_routes[k] = (w, p, c)
 
     return total_cost, chosen_routes
 
@@ -345,7 +395,8 @@ def solve_model(cap_factor=1.0, freight_factor=1.0, verbose=False):
 # 4. Sensitivity analysis
 # ------------------------------------------------------------
 
-def run_scenario(label, cap_factor=1.0, freight_factor=1.0, verbose=False):
+def run_scenario(label, cap_factor=1.0, freight_factor=1.0, verbose=False,
+                 records=None):
     """
     Run one scenario and print a short summary.
     """
@@ -353,7 +404,8 @@ def run_scenario(label, cap_factor=1.0, freight_factor=1.0, verbose=False):
     cost, routes = solve_model(
         cap_factor=cap_factor,
         freight_factor=freight_factor,
-        verbose=verbose
+        verbose=verbose,
+        records=records
     )
     if cost is None:
         print(f"{label}: infeasible.")
@@ -364,11 +416,15 @@ def run_scenario(label, cap_factor=1.0, freight_factor=1.0, verbose=False):
 
 
 if __name__ == "__main__":
+    # Telemetry of every scenario solve, when the telemetry package is available
+    records = [] if SolveRecord is not None else None
+
     # Baseline: 100% capacity, freight at nominal level
     base_cost, base_routes = run_scenario(
         "Baseline (Capacity 100%, Freight 100%)",
         cap_factor=1.0,
-        freight_factor=1.0
+        freight_factor=1.0,
+        records=records
     )
 
     if base_cost is not None:
@@ -376,24 +432,28 @@ if __name__ == "__main__":
         cap120_cost, _ = run_scenario(
             "Capacity +20% (120%), Freight 100%",
             cap_factor=1.2,
-            freight_factor=1.0
+            freight_factor=1.0,
+            records=records
         )
         cap080_cost, _ = run_scenario(
             "Capacity -20% (80%), Freight 100%",
             cap_factor=0.8,
-            freight_factor=1.0
+            freight_factor=1.0,
+            records=records
         )
 
         # Freight sensitivity: ±10% freight, capacity fixed at 100%
         fr110_cost, _ = run_scenario(
             "Capacity 100%, Freight +10% (110%)",
             cap_factor=1.0,
-            freight_factor=1.1
+            freight_factor=1.1,
+            records=records
         )
         fr090_cost, _ = run_scenario(
             "Capacity 100%, Freight -10% (90%)",
             cap_factor=1.0,
-            freight_factor=0.9
+            freight_factor=0.9,
+            records=records
         )
 
         # Report deltas vs baseline (only for feasible scenarios)
@@ -411,3 +471,7 @@ if __name__ == "__main__":
     else:
         print("Baseline scenario infeasible; sensitivity results not computed.")
 
+    if records is not None:
+        print("\n=== Time per phase (seconds) ===")
+        print(format_summary(records))
+
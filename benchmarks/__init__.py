@@ -0,0 +1,7 @@
+"""
+Benchmarks for the projects in this repository.
+
+generators  seeded random instances for every project
+solvers     one solve function per project, returning the objective
+run         size sweeps written to CSV (python -m benchmarks.run)
+"""
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Seeded random instance generators for the projects in this repository.
+
+Every generator takes a size and a seed and returns data in the same
+format the corresponding project code already consumes, so the same
+seed always reproduces the same instance:
+
+  logistics_instance  -> tuple returned by MinCostCodeYawen.read_data()
+  fleet_instance      -> (TRUCKS, data) for model.model(TRUCKS, data)
+  knapsack_items      -> (i_v_w, max_weight) for Knapsack.knapsack()
+  random_graph        -> (nodes, edges) as built in the MST notebook
+  lol_utilities       -> (roles, champions, u) as in the LoL notebook
+  k_set_families      -> list of {"n", "k", "S"} for batch_check.py
+
+The random numbers are drawn as numpy arrays in one go; Python loops
+only convert the arrays into the dictionaries the models expect.
+"""
+
+import itertools
+from collections import defaultdict
+
+import numpy as np
+
+
+# ------------------------------------------------------------
+# 1. Outbound logistics (orders, plants, ports, carrier bands)
+# ------------------------------------------------------------
+
+def logistics_instance(n_products, n_orders=None, n_plants=None, n_ports=None,
+                       n_dests=1, bands_per_lane=5, seed=0):
+    """
+    Random outbound logistics data in the format of read_data().
+
+    Every product gets at least one order and a "home" plant, every
+    plant at least one port, and every (origin port, destination port)
+    lane gets `bands_per_lane` weight bands covering all product weights.
+    Each plant's capacity (in number of orders) is at least 1.5 times the
+    orders of the products whose home plant it is, so sending every
+    product from its home plant is feasible and solve_model() always
+    has an optimal solution.
+    """
+    rng = np.random.default_rng(seed)
+    if n_orders is None:
+        n_orders = 10 * n_products
+    if n_plants is None:
+        n_plants = max(2, n_products // 10)
+    if n_ports is None:
+        n_ports = max(2, n_plants // 2)
+    n_orders = max(n_orders, n_products)
+
+    # ---------- Orders ----------
+    # first n_products orders cover every product once, the rest are random
+    order_prod = np.concatenate([np.arange(n_products),
+                                 rng.integers(0, n_products, n_orders - n_products)])
+    order_qty = rng.integers(100, 5000, n_orders).astype(float)
+    order_wgt = np.round(rng.gamma(2.0, 5.0, n_orders), 2)
+    prod_dest_idx = rng.integers(0, n_dests, n_products)
+
+    product_ids = 1_000_000 + np.arange(n_products)
+    dest_names = [f"PORT{90 + d:02d}" for d in range(n_dests)]
+
+    orders = [(int(product_ids[k]), 1_000_000_000 + i, float(q), float(w),
+               dest_names[prod_dest_idx[k]])
+              for i, (k, q, w) in enumerate(zip(order_prod, order_qty, order_wgt))]
+
+    units = np.bincount(order_prod, weights=order_qty, minlength=n_products)
+    weight = np.bincount(order_prod, weights=order_wgt, minlength=n_products)
+    count = np.bincount(order_prod, minlength=n_products)
+
+    products = [int(p) for p in product_ids]
+    prod_units = defaultdict(float, zip(products, units.tolist()))
+    prod_weight = defaultdict(float, zip(products, weight.tolist()))
+    prod_dest = {products[k]: dest_names[d] for k, d in enumerate(prod_dest_idx)}
+    prod_order_count = defaultdict(int, zip(products, count.tolist()))
+
+    # ---------- Plants ----------
+    plants = [f"PLANT{w + 1:02d}" for w in range(n_plants)]
+    home = rng.integers(0, n_plants, n_products)
+    home_orders = np.bincount(home, weights=count, minlength=n_plants)
+    capacity = np.ceil(1.5 * home_orders * rng.uniform(1.0, 1.2, n_plants)) + 1
+    unit_cost = np.round(rng.uniform(0.2, 1.5, n_plants), 4)
+    plant_capacity = dict(zip(plants, capacity.tolist()))
+    plant_unit_cost = dict(zip(plants, unit_cost.tolist()))
+
+    # ---------- Product -> Plant ----------
+    # each product can be made in its home plant plus a few random others
+    pp_mask = rng.random((n_products, n_plants)) < min(1.0, 2.0 / n_plants)
+    pp_mask[np.arange(n_products), home] = True
+    prod_plants = defaultdict(set)
+    for k, w in zip(*np.nonzero(pp_mask)):
+        prod_plants[products[k]].add(plants[w])
+
+    # ---------- Plant -> Port ----------
+    ports = [f"PORT{p + 1:02d}" for p in range(n_ports)]
+    wp_mask = rng.random((n_plants, n_ports)) < 0.3
+    wp_mask[np.arange(n_plants), rng.integers(0, n_ports, n_plants)] = True
+    plant_ports = defaultdict(set)
+    for w, p in zip(*np.nonzero(wp_mask)):
+        plant_ports[plants[w]].add(ports[p])
+
+    # ---------- Carrier bands ----------
+    # one row per (origin port, destination port, weight band)
+    n_bands = n_ports * n_dests * bands_per_lane
+    lane_orig = np.repeat(np.arange(n_ports), n_dests * bands_per_lane)
+    lane_dest = np.tile(np.repeat(np.arange(n_dests), bands_per_lane), n_ports)
+    band_no = np.tile(np.arange(bands_per_lane), n_ports * n_dests)
+    edges = np.linspace(0.0, float(weight.max()) + 1.0, bands_per_lane + 1)
+    min_w, max_w = edges[band_no], edges[band_no + 1]
+    min_cost = np.round(rng.uniform(1.0, 50.0, n_bands), 2)
+    rate = np.round(rng.uniform(0.02, 2.0, n_bands), 4)
+    carrier = rng.integers(1, 10, n_bands)
+
+    carrier_bands = list(range(1, n_bands + 1))
+    band_info = {
+        c: (f"V444_{carrier[i]}", "V88888888_0", ports[lane_orig[i]],
+            float(min_w[i]), float(max_w[i]), float(min_cost[i]),
+            float(rate[i]), dest_names[lane_dest[i]], "DTD")
+        for i, c in enumerate(carrier_bands)
+    }
+
+    return (orders, products, prod_units, prod_weight, prod_dest,
+            plants, plant_capacity, plant_unit_cost,
+            prod_plants, plant_ports,
+            carrier_bands, band_info,
+            prod_order_count)
+
+
+# ------------------------------------------------------------
+# 2. Fleet (depots, stations, trucks)
+# ------------------------------------------------------------
+
+def fleet_instance(n_stations, n_depots=None, n_trucks=None, seed=0):
+    """
+    Random fleet data in the format of model.default_data().
+
+    Ranges follow the hand-written data in model.py: two products,
+    trucks alternating between (30, 15) and (15, 30) capacity, station
+    stock around 5% of the station's full capacity.
+
+    Returns
+    -------
+    TRUCKS : list of str
+    data : dict
+    """
+    rng = np.random.default_rng(seed)
+    if n_depots is None:
+        n_depots = max(2, n_stations // 4)
+    if n_trucks is None:
+        n_trucks = max(2, 3 * n_stations // 2)
+
+    DEPOTS = [f"D{d + 1}" for d in range(n_depots)]
+    STATIONS = [f"S{s + 1}" for s in range(n_stations)]
+    PRODUCTS = ['P1', 'P2']
+    TRUCKS = [f"T{t + 1}" for t in range(n_trucks)]
+
+    dist = rng.integers(10, 101, (n_depots, n_stations))
+    supply = rng.integers(80_000, 150_001, (n_depots, len(PRODUCTS)))
+    # odd trucks carry more P1, even trucks more P2 (as T1, T2, ... in model.py)
+    cap_truck = np.where(np.arange(n_trucks)[:, None] % 2 == 0, [30, 15], [15, 30])
+    full_cap = rng.choice([1600, 1800, 2200, 2600], (n_stations, len(PRODUCTS)))
+    stock = np.round(full_cap * rng.uniform(0.04, 0.06, full_cap.shape)).astype(int)
+    sales = rng.integers(10, 50, (n_stations, len(PRODUCTS)))
+
+    def as_dict(rows, cols, values):
+        return {(r, c): int(values[i, j])
+                for i, r in enumerate(rows) for j, c in enumerate(cols)}
+
+    data = {
+        'DEPOTS': DEPOTS,
+        'STATIONS': STATIONS,
+        'PRODUCTS': PRODUCTS,
+        'distance': as_dict(DEPOTS, STATIONS, dist),
+        'supply': as_dict(DEPOTS, PRODUCTS, supply),
+        'capacity_truck': as_dict(TRUCKS, PRODUCTS, cap_truck),
+        'capacity_station': as_dict(STATIONS, PRODUCTS, stock),
+        'sales_station': as_dict(STATIONS, PRODUCTS, sales),
+        'full_capacity_station': as_dict(STATIONS, PRODUCTS, full_cap),
+    }
+    return TRUCKS, data
+
+
+# ------------------------------------------------------------
+# 3. Knapsack items
+# ------------------------------------------------------------
+
+def knapsack_items(n_items, max_weight=None, seed=0):
+    """
+    Random [value, weight] items and a capacity for Knapsack.knapsack().
+    The default capacity is about a quarter of the total item weight.
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 20, n_items)
+    values = rng.integers(1, 500, n_items)
+    if max_weight is None:
+        max_weight = max(1, int(weights.sum()) // 4)
+    i_v_w = np.column_stack([values, weights]).tolist()
+    return i_v_w, max_weight
+
+
+# ------------------------------------------------------------
+# 4. Graphs for MST / TSP
+# ------------------------------------------------------------
+
+def random_graph(n_nodes, n_extra_edges=None, max_cost=None, seed=0):
+    """
+    Random connected graph in the format of the MST notebook.
+
+    A random spanning tree (node i is connected to a random earlier
+    node) guarantees connectivity; `n_extra_edges` further distinct edges
+    are sampled without replacement from the remaining pairs. With
+    n_extra_edges=None the graph is complete. Costs are integers in
+    1..max_cost (default n_nodes).
+
+    Returns
+    -------
+    nodes : list of str
+        Labels X_{1}, ..., X_{n}.
+    edges : dict[(u, v) -> int]
+        Undirected edges keyed by the sorted pair of labels.
+    """
+    rng = np.random.default_rng(seed)
+    if max_cost is None:
+        max_cost = n_nodes
+    nodes = [f"X_{{{i}}}" for i in range(1, n_nodes + 1)]
+
+    # spanning tree: node i (i >= 1) attaches to a uniform node in 0..i-1
+    child = np.arange(1, n_nodes)
+    parent = np.floor(rng.random(n_nodes - 1) * child).astype(int)
+
+    # all pairs i < j are numbered by their position in the upper triangle
+    iu, ju = np.triu_indices(n_nodes, 1)
+    pair_id = np.full((n_nodes, n_nodes), -1)
+    pair_id[iu, ju] = np.arange(len(iu))
+    tree_ids = pair_id[parent, child]
+
+    rest = np.setdiff1d(np.arange(len(iu)), tree_ids)
+    if n_extra_edges is None:
+        extra_ids = rest
+    else:
+        extra_ids = rng.choice(rest, min(n_extra_edges, len(rest)), replace=False)
+
+    ids = np.concatenate([tree_ids, extra_ids])
+    costs = rng.integers(1, max_cost + 1, len(ids))
+
+    edges = {tuple(sorted((nodes[iu[e]], nodes[ju[e]]))): int(c)
+             for e, c in zip(ids, costs)}
+    return nodes, edges
+
+
+# ------------------------------------------------------------
+# 5. LoL utility matrices
+# ------------------------------------------------------------
+
+def lol_utilities(n_roles, n_champions=None, seed=0):
+    """
+    Random integer utilities u[(role, champ)] in 0..10, in the format of
+    create_baseline_instance() from the LoL notebook.
+    """
+    rng = np.random.default_rng(seed)
+    if n_champions is None:
+        n_champions = 2 * n_roles
+    roles = [f"R{r + 1}" for r in range(n_roles)]
+    champions = [f"C{c + 1}" for c in range(n_champions)]
+    u = rng.integers(0, 11, (n_roles, n_champions))
+    utilities = {(r, c): int(u[i, j])
+                 for i, r in enumerate(roles) for j, c in enumerate(champions)}
+    return roles, champions, utilities
+
+
+# ------------------------------------------------------------
+# 6. k-set families for the threshold checker
+# ------------------------------------------------------------
+
+def k_set_families(n, k, n_families=1, density=0.3, seed=0):
+    """
+    Random families S of k-subsets of 1..n, each k-set included with
+    probability `density`. Returns a list of {"n", "k", "S"} dicts, the
+    input format of batch_check.py.
+    """
+    rng = np.random.default_rng(seed)
+    ksets = np.array(list(itertools.combinations(range(1, n + 1), k)))
+    mask = rng.random((n_families, len(ksets))) < density
+    return [{"n": n, "k": k, "S": ksets[row].tolist()} for row in mask]
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark runner: sweep instance sizes for each project and record wall
+time, peak memory and objective value to a CSV file.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run --cases knapsack tsp --repeat 3 --out bench.csv
+    python -m benchmarks.run --cases mst --sizes 5 8 10 --trace-memory --out mst.csv
+
+The CSV always goes to a file: the project code prints progress and
+solver messages (fleet shifts, AMPL, Gurobi) to stdout while it runs.
+
+Each row of the CSV is one solve:
+
+    case, size, seed, gen_seconds, wall_seconds, peak_mem_mb, objective
+
+The instance for (case, size, seed) is always the same, so two CSV files
+produced with the same arguments can be compared row by row between
+releases. wall_seconds always comes from an untraced solve. With
+--trace-memory the instance is solved a second time under tracemalloc
+for peak_mem_mb (left empty otherwise), because tracemalloc slows down
+allocation-heavy Python code by up to an order of magnitude. It only
+covers Python allocations; memory used inside external solver processes
+(AMPL, Gurobi, CBC) is not included.
+"""
+
+import argparse
+import csv
+import time
+import tracemalloc
+
+from benchmarks import generators, solvers
+
+
+# name -> (instance generator (size, seed), solve function, default sizes)
+CASES = {
+    "logistics": (lambda size, seed: generators.logistics_instance(size, seed=seed),
+                  solvers.solve_logistics, [50, 100, 200, 400]),
+    "fleet": (lambda size, seed: generators.fleet_instance(size, seed=seed),
+              solvers.solve_fleet, [4, 8, 16, 32]),
+    "knapsack": (lambda size, seed: generators.knapsack_items(size, seed=seed),
+                 solvers.solve_knapsack, [10, 100, 500, 1000]),
+    "mst": (lambda size, seed: generators.random_graph(size, 2 * size, seed=seed),
+            solvers.solve_mst_lp, [5, 8, 10, 12]),
+    "tsp": (lambda size, seed: generators.random_graph(size, seed=seed),
+            solvers.solve_tsp, [25, 50, 100, 200]),
+    "lol": (lambda size, seed: generators.lol_utilities(size, seed=seed),
+            solvers.solve_lol, [5, 20, 50, 100]),
+    "kset": (lambda size, seed: generators.k_set_families(size, 3, seed=seed),
+             solvers.solve_k_set, [5, 6, 7, 8]),
+}
+
+FIELDS = ["case", "size", "seed", "gen_seconds", "wall_seconds",
+          "peak_mem_mb", "objective"]
+
+
+def peak_memory_mb(solve, instance):
+    """Peak Python memory (MB) traced by tracemalloc while solving `instance`."""
+    tracemalloc.start()
+    try:
+        solve(instance)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 2**20, 3)
+
+
+def run_one(case, size, seed, trace_memory=False):
+    """
+    Generate and solve one instance; return a CSV row as a dict. The timed
+    solve runs without tracemalloc; with trace_memory the instance is
+    solved once more under tracemalloc for peak_mem_mb.
+    """
+    generate, solve, _ = CASES[case]
+
+    start = time.perf_counter()
+    instance = generate(size, seed)
+    gen_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    objective = solve(instance)
+    wall_seconds = time.perf_counter() - start
+
+    return {
+        "case": case,
+        "size": size,
+        "seed": seed,
+        "gen_seconds": round(gen_seconds, 6),
+        "wall_seconds": round(wall_seconds, 6),
+        "peak_mem_mb": peak_memory_mb(solve, instance) if trace_memory else None,
+        "objective": objective,
+    }
+
+
+def run_sweep(cases, out, sizes=None, repeat=1, seed=0, trace_memory=False):
+    """
+    Run every case over its sizes (or the given `sizes`), `repeat` times
+    with seeds seed, seed+1, ..., and write the rows to the file `out` as
+    CSV.
+    Rows are flushed as they are produced, so a long sweep can be
+    watched or interrupted without losing finished results.
+    """
+    writer = csv.DictWriter(out, fieldnames=FIELDS)
+    writer.writeheader()
+    for case in cases:
+        for size in (sizes or CASES[case][2]):
+            for r in range(repeat):
+                writer.writerow(run_one(case, size, seed + r, trace_memory))
+                out.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the project models.")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES),
+                        default=sorted(CASES), help="cases to run (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=None,
+                        help="instance sizes (default: per-case sizes)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="runs per size, with consecutive seeds")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="solve each instance again under tracemalloc for peak_mem_mb")
+    parser.add_argument("--out", required=True,
+                        help="CSV file (not stdout, which carries solver output)")
+    args = parser.parse_args()
+
+    with open(args.out, "w", newline="") as f:
+        run_sweep(args.cases, f, args.sizes, args.repeat, args.seed,
+                  args.trace_memory)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Solve functions used by the benchmark runner, one per project.
+
+Each function takes an instance produced by benchmarks.generators and
+returns the objective value. Where a project ships importable Python
+code, that code is loaded from its folder and called directly; the MST
+and TSP formulations only exist as notebook cells, so they are
+reproduced here as functions.
+"""
+
+import heapq
+import importlib.util
+import itertools
+import json
+import os
+import types
+from collections import defaultdict
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOGISTICS_FILE = os.path.join(REPO_DIR, "Minimum Warehouse and Transportation Cost-Yawen",
+                              "MinCostCodeYawen.py")
+FLEET_FILE = os.path.join(REPO_DIR, "Fleet Optimization Problem - Mo & John", "model.py")
+KNAPSACK_FILE = os.path.join(REPO_DIR, "Dynamic Programming - Rina and Noura", "Knapsack.py")
+THRESHOLD_FILE = os.path.join(REPO_DIR, "Generalized Threshold Graph LP", "Code",
+                              "batch_check.py")
+LOL_NOTEBOOK = os.path.join(
+    REPO_DIR,
+    "League-of-Legends-ban–pick-phase-as-an-assignment-min‑cost-flow-problem:"
+    "-Hanbyul-(Han)-Lee",
+    "project_materials", "lol_banpick_mincostflow_parametric.ipynb")
+
+_modules = {}
+_sessions = {}
+
+
+def load_module(path, name):
+    """Import a project file by path (the project folders are not packages)."""
+    if name not in _modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+
+def load_notebook(path, name):
+    """
+    Run the code cells of a notebook as a module. Only useful for
+    notebooks whose cells define functions and keep the script part
+    behind `if __name__ == "__main__"`.
+    """
+    if name not in _modules:
+        with open(path, encoding="utf-8") as f:
+            nb = json.load(f)
+        source = "\n".join("".join(cell["source"]) for cell in nb["cells"]
+                           if cell["cell_type"] == "code")
+        module = types.ModuleType(name)
+        exec(compile(source, path, "exec"), module.__dict__)
+        _modules[name] = module
+    return _modules[name]
+
+
+# ------------------------------------------------------------
+# 1. Project code
+# ------------------------------------------------------------
+
+def solve_logistics(data):
+    logistics = load_module(LOGISTICS_FILE, "MinCostCodeYawen")
+    total_cost, _ = logistics.solve_model(data=data)
+    if total_cost is None:
+        raise RuntimeError("logistics instance has no optimal solution")
+    return total_cost
+
+
+def solve_fleet(instance, shifts=60):
+    fleet = load_module(FLEET_FILE, "fleet_model")
+    TRUCKS, data = instance
+    df_summary = fleet.model(TRUCKS, data=data, shifts=shifts)
+    return float(df_summary['Shipped'].sum())
+
+
+def solve_knapsack(instance):
+    knapsack = load_module(KNAPSACK_FILE, "Knapsack")
+    i_v_w, max_weight = instance
+    return knapsack.knapsack(i_v_w, max_weight)[-1][-1]
+
+
+def solve_lol(instance):
+    lol = load_notebook(LOL_NOTEBOOK, "lol_banpick_mincostflow")
+    roles, champions, utilities = instance
+    G = lol.build_lol_min_cost_flow_graph(roles, champions, utilities)
+    _, total_utility, _ = lol.solve_lol_min_cost_flow(G, roles, champions, utilities)
+    return total_utility
+
+
+def solve_k_set(families, solver="highs"):
+    """Margin delta of each family, summed (a family without solution adds 0)."""
+    threshold = load_module(THRESHOLD_FILE, "batch_check")
+    if solver not in _sessions:
+        _sessions[solver] = threshold.open_session(solver)
+    total = 0.0
+    for family in families:
+        key, _ = threshold.canonical_form(family["n"], family["k"], family["S"])
+        _, result = threshold.solve_canonical(key, _sessions[solver])
+        total += result.get("delta", 0.0)
+    return total
+
+
+# ------------------------------------------------------------
+# 2. MST as an LP (from the MST notebook)
+# ------------------------------------------------------------
+
+def solve_mst_lp(instance):
+    """
+    MST with one subtour elimination constraint per node subset, as in
+    the notebook. The number of constraints grows as 2^n, so keep n small.
+    """
+    import pulp
+
+    nodes, edges = instance
+    prob = pulp.LpProblem("MST", pulp.LpMinimize)
+
+    # Decision variables x_ij in {0,1}
+    x = pulp.LpVariable.dicts("x", edges, 0, 1, cat="Binary")
+
+    # Objective: minimize total cost
+    prob += pulp.lpSum(edges[e] * x[e] for e in edges)
+
+    # Constraint: select n - 1 edges
+    prob += pulp.lpSum(x[e] for e in edges) == len(nodes) - 1
+
+    # Constraint: Subtour elimination constraints
+    for r in range(1, len(nodes)):
+        for S in itertools.combinations(nodes, r):
+            S = set(S)
+            S_edges = [e for e in edges if e[0] in S and e[1] in S]
+            if S_edges:
+                prob += pulp.lpSum(x[e] for e in S_edges) <= len(S) - 1
+
+    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    return pulp.value(prob.objective)
+
+
+# ------------------------------------------------------------
+# 3. Christofides TSP tour (from the MST notebook)
+# ------------------------------------------------------------
+
+def dijkstra(start, nodes, adj):
+    dist = {v: float("inf") for v in nodes}
+    dist[start] = 0.0
+    heap = [(0.0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in adj[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def prim_mst(nodes, dist):
+    start = nodes[0]
+    in_mst = {v: False for v in nodes}
+    key = {v: float("inf") for v in nodes}
+    parent = {v: None for v in nodes}
+    key[start] = 0.0
+    for _ in range(len(nodes)):
+        u = min((v for v in nodes if not in_mst[v]), key=lambda v: key[v])
+        in_mst[u] = True
+        for v in nodes:
+            if not in_mst[v] and dist[u][v] < key[v]:
+                key[v] = dist[u][v]
+                parent[v] = u
+    mst_edges = []
+    degrees = {v: 0 for v in nodes}
+    for v in nodes:
+        if parent[v] is not None:
+            u = parent[v]
+            mst_edges.append((u, v))
+            degrees[u] += 1
+            degrees[v] += 1
+    return mst_edges, degrees
+
+
+def eulerian_tour(adj, start):
+    local_adj = {u: list(vs) for u, vs in adj.items()}
+    stack = [start]
+    path = []
+    while stack:
+        u = stack[-1]
+        if local_adj[u]:
+            v = local_adj[u].pop()
+            local_adj[v].remove(u)
+            stack.append(v)
+        else:
+            path.append(stack.pop())
+    return path[::-1]
+
+
+def solve_tsp(instance):
+    """
+    Christofides-style tour on the shortest-path metric of the graph:
+    Prim MST, greedy matching of odd-degree vertices, Eulerian tour,
+    shortcut. Returns the tour cost.
+    """
+    nodes, edges = instance
+
+    adj = {v: [] for v in nodes}
+    for (u, v), w in edges.items():
+        adj[u].append((v, w))
+        adj[v].append((u, w))
+    dist = {u: dijkstra(u, nodes, adj) for u in nodes}
+
+    mst_edges, degrees = prim_mst(nodes, dist)
+
+    # Greedy matching on odd-degree vertices (sorted, so ties between equal
+    # distances do not depend on string hashing and runs are reproducible)
+    unmatched = {v for v, deg in degrees.items() if deg % 2 == 1}
+    matching_edges = []
+    while len(unmatched) > 1:
+        i = min(unmatched)
+        j = min(sorted(j for j in unmatched if j != i), key=lambda j: dist[i][j])
+        matching_edges.append((i, j))
+        unmatched.remove(i)
+        unmatched.remove(j)
+
+    multi_adj = defaultdict(list)
+    for u, v in mst_edges + matching_edges:
+        multi_adj[u].append(v)
+        multi_adj[v].append(u)
+
+    visited = set()
+    tour = []
+    for v in eulerian_tour(multi_adj, nodes[0]):
+        if v not in visited:
+            visited.add(v)
+            tour.append(v)
+    tour.append(tour[0])
+
+    return sum(dist[tour[i]][tour[i + 1]] for i in range(len(tour) - 1))
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Telemetry shared by the model drivers in this repository.
+
+Every solve is described by one SolveRecord, whichever modelling layer
+(gurobipy, amplpy, pulp) the driver uses:
+
+  phases     wall time per phase, filled by `with record.phase("solve"):`.
+             All drivers use the same four phases:
+               load     reading and preparing data in Python (files,
+                        generators, dictionaries),
+               build    everything that puts model or data into the
+                        modelling layer (gurobipy / pulp model
+                        construction, AMPL read, set and param
+                        assignments, AMPL model generation),
+               solve    the solver itself,
+               extract  reading the solution back into Python.
+  counters   integers such as number of variables or constraints.
+  solver     status, objective, nodes, iterations, gap and the solver's
+             own reported time, filled by gurobi_stats / ampl_stats /
+             pulp_stats.
+
+Optionally cProfile and tracemalloc run during the phases
+(SolveRecord(..., profile=True, trace_memory=True)); the drivers pass
+their own profile= and trace_memory= arguments through. Phases of one
+record cannot be nested, and peak_mem_mb is the largest peak seen in any
+single phase.
+
+AMPL generates the model instance inside solve, so amplpy drivers call
+solve_ampl(), which moves that generation time from solve to build.
+
+The drivers run without this package too; they then keep no records.
+
+Drivers accept a `records` list and append one record per solve, so runs
+can be aggregated across scenario sweeps or the shifts of the fleet
+model with summarize() / format_summary() or saved with write_records().
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PHASES = ["load", "build", "solve", "extract"]
+SOLVER_FIELDS = ["status", "objective", "nodes", "iterations", "gap", "solver_seconds"]
+
+
+class SolveRecord:
+    """Timings, counters and solver statistics of one solve."""
+
+    def __init__(self, driver, label=None, profile=False, trace_memory=False):
+        self.driver = driver
+        self.label = label
+        self.phases = {}
+        self.counters = {}
+        self.solver = {}
+        self.peak_mem_mb = None
+        self.trace_memory = trace_memory
+        self.profiler = cProfile.Profile() if profile else None
+        self.open_phase = None
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Add the wall time of the block to phase `name`. Raises
+        RuntimeError inside another phase of the same record, since the
+        time would be counted twice.
+        """
+        if self.open_phase is not None:
+            raise RuntimeError(f"phase {name!r} started inside phase {self.open_phase!r}")
+        self.open_phase = name
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        if self.profiler is not None:
+            self.profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.profiler is not None:
+                self.profiler.disable()
+            if self.trace_memory and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1] / 2**20
+                self.peak_mem_mb = max(self.peak_mem_mb or 0.0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            self.open_phase = None
+
+    def transfer(self, seconds, source, target):
+        """Move `seconds` of already recorded time from phase `source` to `target`."""
+        seconds = min(seconds, self.phases.get(source, 0.0))
+        self.phases[source] = self.phases.get(source, 0.0) - seconds
+        self.phases[target] = self.phases.get(target, 0.0) + seconds
+
+    def count(self, name, n=1):
+        """Increase counter `name` by n."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def set_solver_stats(self, **stats):
+        """Store solver statistics (see SOLVER_FIELDS); None values are skipped."""
+        self.solver.update({k: v for k, v in stats.items() if v is not None})
+
+    def profile_stats(self, limit=20, sort="cumulative"):
+        """Top `limit` functions of the cProfile run as text, or None."""
+        if self.profiler is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def total_seconds(self):
+        return sum(self.phases.values())
+
+    def to_dict(self):
+        """
+        Flat dictionary (one row of a table): driver, label, <phase>_s for
+        every phase, total_s, the solver fields, the counters and
+        peak_mem_mb.
+        """
+        row = {"driver": self.driver, "label": self.label}
+        for name in PHASES + sorted(set(self.phases) - set(PHASES)):
+            row[f"{name}_s"] = self.phases.get(name, 0.0)
+        row["total_s"] = self.total_seconds()
+        for name in SOLVER_FIELDS:
+            row[name] = self.solver.get(name)
+        row.update(self.counters)
+        row["peak_mem_mb"] = self.peak_mem_mb
+        return row
+
+    def __repr__(self):
+        phases = ", ".join(f"{k}={v:.3f}s" for k, v in self.phases.items())
+        return f"SolveRecord({self.driver!r}, {self.label!r}, {phases})"
+
+
+# ------------------------------------------------------------
+# Solver statistics per modelling layer
+# ------------------------------------------------------------
+
+def gurobi_stats(m):
+    """Statistics of a solved gurobipy Model."""
+    stats = {"status": m.Status, "iterations": m.IterCount,
+             "solver_seconds": m.Runtime}
+    if m.IsMIP:
+        stats["nodes"] = m.NodeCount
+    if m.SolCount > 0:
+        stats["objective"] = m.ObjVal
+        if m.IsMIP:
+            stats["gap"] = m.MIPGap
+    return stats
+
+
+def _match_number(pattern, text):
+    found = re.search(pattern, text)
+    return float(found.group(1)) if found else None
+
+
+def ampl_stats(ampl):
+    """
+    Statistics of the last amplpy solve. AMPL only reports iterations,
+    nodes and the MIP gap inside the solver's message, so these are read
+    from solve_message and are missing when the solver does not print them.
+    """
+    message = ampl.get_value("solve_message")
+    iterations = _match_number(r"(\d+)\s+(?:simplex|dual simplex|barrier)?\s*iterations?",
+                               message)
+    nodes = _match_number(r"(\d+)\s+(?:branching|branch-and-cut|branch-and-bound)\s+nodes?",
+                          message)
+    gap = _match_number(r"relmipgap\s*=\s*([-+0-9.eE]+)", message)
+    objective = ampl.get_current_objective()
+    return {
+        "status": ampl.get_value("solve_result"),
+        "objective": objective.value() if objective is not None else None,
+        "iterations": int(iterations) if iterations is not None else None,
+        "nodes": int(nodes) if nodes is not None else None,
+        "gap": gap,
+        "solver_seconds": ampl.get_value("_solve_elapsed_time"),
+    }
+
+
+def solve_ampl(record, ampl):
+    """
+    ampl.solve() timed as phase "solve", then split: the solver's own
+    elapsed time (_solve_elapsed_time) stays in solve, and the rest, which
+    AMPL spends generating the model instance, moves to build. Solver
+    statistics are stored on the record.
+    """
+    start = record.phases.get("solve", 0.0)
+    with record.phase("solve"):
+        ampl.solve()
+    elapsed = record.phases["solve"] - start
+    stats = ampl_stats(ampl)
+    record.set_solver_stats(**stats)
+    solver_seconds = stats["solver_seconds"] or 0.0
+    record.transfer(max(0.0, elapsed - solver_seconds), "solve", "build")
+    return stats
+
+
+def pulp_stats(prob):
+    """Statistics of a solved pulp problem (CBC via pulp reports no nodes or iterations)."""
+    import pulp
+
+    return {
+        "status": pulp.LpStatus[prob.status],
+        "objective": pulp.value(prob.objective),
+        "solver_seconds": getattr(prob, "solutionTime", None),
+    }
+
+
+# ------------------------------------------------------------
+# Aggregation
+# ------------------------------------------------------------
+
+def summarize(records):
+    """
+    Totals per driver: number of solves, seconds per phase and total
+    seconds, summed over all records.
+    """
+    summary = {}
+    for record in records:
+        row = summary.setdefault(record.driver, {"solves": 0, "total_s": 0.0})
+        row["solves"] += 1
+        row["total_s"] += record.total_seconds()
+        for name, seconds in record.phases.items():
+            row[f"{name}_s"] = row.get(f"{name}_s", 0.0) + seconds
+    return summary
+
+
+def format_summary(records):
+    """summarize() as a small text table."""
+    summary = summarize(records)
+    lines = [f"{'driver':<20}{'solves':>8}" + "".join(f"{p + '_s':>11}" for p in PHASES)
+             + f"{'total_s':>11}"]
+    for driver, row in summary.items():
+        lines.append(f"{driver:<20}{row['solves']:>8}"
+                     + "".join(f"{row.get(p + '_s', 0.0):>11.3f}" for p in PHASES)
+                     + f"{row['total_s']:>11.3f}")
+    return "\n".join(lines)
+
+
+def write_records(records, path):
+    """Append records to a JSON lines file, one to_dict() per line."""
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record.to_dict(), default=str) + "\n")